@@ -9,6 +9,7 @@ import sys
 import json
 import base64
 import tempfile
+import subprocess
 import traceback
 from datetime import datetime
 from io import StringIO
@@ -16,17 +17,16 @@ from flask import Flask, request, jsonify
 from flask_cors import CORS
 
 # Install required packages if not available
-def install_package(package):
-    import subprocess
+def install_package(package, module_name=None):
     try:
-        __import__(package)
+        __import__(module_name or package)
     except ImportError:
         print(f"Installing {package}...")
         subprocess.check_call([sys.executable, "-m", "pip", "install", package])
 
 # Install dependencies
 install_package("flask")
-install_package("flask-cors")
+install_package("flask-cors", "flask_cors")
 install_package("ezdxf")
 
 # Import ezdxf library after installation
@@ -41,66 +41,81 @@ CORS(app)  # Enable CORS for frontend integration
 # Server configuration
 SERVER_PORT = 8080
 SERVER_HOST = '127.0.0.1'
+BANNER_LINE = "=" * 60
+
+# Common ezdxf errors and solutions: (matcher on the lowercased message, suggestions)
+ERROR_HINTS = [
+    (lambda msg: "dimpost" in msg, [
+        "DO NOT set dimpost parameter - it causes 'Invalid dimpost string' errors",
+        "DO NOT add units to dimension text (e.g., text='<> mm')",
+        "Use only text='<>' for automatic measurements",
+        "Remove any dimpost, dimunit, or unit-related parameters"
+    ]),
+    (lambda msg: "render" in msg, [
+        "Make sure to call dim.render() after creating dimensions",
+        "Example: dim = msp.add_linear_dim(...); dim.render()"
+    ]),
+    (lambda msg: "dimension" in msg and "style" in msg, [
+        "Use setup=True when creating document: doc = ezdxf.new('R2010', setup=True)",
+        "Configure dimstyle before creating dimensions"
+    ]),
+    (lambda msg: "layer" in msg, [
+        "Create layers before using them: doc.layers.add(name='LAYERNAME', color=7)",
+        "Check layer names in dxfattribs={'layer': 'LAYERNAME'}"
+    ]),
+    (lambda msg: "save" in msg, [
+        "Make sure to save the document: doc.saveas('filename.dxf')",
+        "Check file permissions and disk space"
+    ]),
+    (lambda msg: "import" in msg, [
+        "Check import statements - use: import ezdxf",
+        "Make sure all required modules are imported"
+    ]),
+    (lambda msg: "attribute" in msg, [
+        "Check object method names and attributes",
+        "Verify ezdxf syntax - refer to documentation"
+    ]),
+    (lambda msg: "coordinate" in msg or "point" in msg, [
+        "Check coordinate format: use (x, y) tuples for 2D points",
+        "Ensure coordinates are numeric values"
+    ]),
+    (lambda msg: "leader" in msg, [
+        "DO NOT use msp.add_leader() - it causes errors",
+        "Use simple lines and text instead of complex leaders"
+    ]),
+]
+
+DEFAULT_SUGGESTIONS = [
+    "Check the ezdxf documentation for correct syntax",
+    "Verify all required parameters are provided",
+    "Make sure the code follows ezdxf patterns"
+]
+
+COMMON_FIXES = [
+    "Add doc = ezdxf.new('R2010', setup=True) at the beginning",
+    "Create layers before using them",
+    "Call dim.render() after creating dimensions",
+    "Add doc.saveas('filename.dxf') at the end"
+]
 
 def analyze_error(error_msg, traceback_str, code):
     """
     Analyze common ezdxf errors and provide helpful suggestions
     """
-    suggestions = []
-
-    # Common ezdxf errors and solutions
-    if "dimpost" in error_msg.lower() or "invalid dimpost string" in error_msg.lower():
-        suggestions.append("DO NOT set dimpost parameter - it causes 'Invalid dimpost string' errors")
-        suggestions.append("DO NOT add units to dimension text (e.g., text='<> mm')")
-        suggestions.append("Use only text='<>' for automatic measurements")
-        suggestions.append("Remove any dimpost, dimunit, or unit-related parameters")
-
-    if "render" in error_msg.lower():
-        suggestions.append("Make sure to call dim.render() after creating dimensions")
-        suggestions.append("Example: dim = msp.add_linear_dim(...); dim.render()")
-
-    if "dimension" in error_msg.lower() and "style" in error_msg.lower():
-        suggestions.append("Use setup=True when creating document: doc = ezdxf.new('R2010', setup=True)")
-        suggestions.append("Configure dimstyle before creating dimensions")
-
-    if "layer" in error_msg.lower():
-        suggestions.append("Create layers before using them: doc.layers.add(name='LAYERNAME', color=7)")
-        suggestions.append("Check layer names in dxfattribs={'layer': 'LAYERNAME'}")
+    message = error_msg.lower()
 
-    if "saveas" in error_msg.lower() or "save" in error_msg.lower():
-        suggestions.append("Make sure to save the document: doc.saveas('filename.dxf')")
-        suggestions.append("Check file permissions and disk space")
-
-    if "import" in error_msg.lower():
-        suggestions.append("Check import statements - use: import ezdxf")
-        suggestions.append("Make sure all required modules are imported")
-
-    if "attribute" in error_msg.lower():
-        suggestions.append("Check object method names and attributes")
-        suggestions.append("Verify ezdxf syntax - refer to documentation")
-
-    if "coordinate" in error_msg.lower() or "point" in error_msg.lower():
-        suggestions.append("Check coordinate format: use (x, y) tuples for 2D points")
-        suggestions.append("Ensure coordinates are numeric values")
-
-    if "leader" in error_msg.lower():
-        suggestions.append("DO NOT use msp.add_leader() - it causes errors")
-        suggestions.append("Use simple lines and text instead of complex leaders")
+    suggestions = []
+    for matches, hints in ERROR_HINTS:
+        if matches(message):
+            suggestions.extend(hints)
 
     if not suggestions:
-        suggestions.append("Check the ezdxf documentation for correct syntax")
-        suggestions.append("Verify all required parameters are provided")
-        suggestions.append("Make sure the code follows ezdxf patterns")
+        suggestions.extend(DEFAULT_SUGGESTIONS)
 
     return {
         'suggestions': suggestions,
         'error_type': type(error_msg).__name__,
-        'common_fixes': [
-            "Add doc = ezdxf.new('R2010', setup=True) at the beginning",
-            "Create layers before using them",
-            "Call dim.render() after creating dimensions",
-            "Add doc.saveas('filename.dxf') at the end"
-        ]
+        'common_fixes': list(COMMON_FIXES)
     }
 
 # Image generation removed - only DXF files are generated now
@@ -319,9 +334,9 @@ def test_ezdxf():
 
 def print_startup_info():
     """Print server startup information"""
-    print("\n" + "="*60)
+    print("\n" + BANNER_LINE)
     print("🏗️  HSR Construction Estimator - ezdxf Drawing Server")
-    print("="*60)
+    print(BANNER_LINE)
     print(f"🚀 Server starting on: http://{SERVER_HOST}:{SERVER_PORT}")
     print(f"📐 ezdxf version: {ezdxf.version}")
     print(f"🕒 Started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
@@ -330,7 +345,7 @@ def print_startup_info():
     print(f"   • Generate drawing: http://{SERVER_HOST}:{SERVER_PORT}/generate-drawing")
     print(f"   • Test ezdxf: http://{SERVER_HOST}:{SERVER_PORT}/test")
     print("\n✅ Server is ready to generate professional DXF drawings!")
-    print("="*60)
+    print(BANNER_LINE)
 
 if __name__ == '__main__':
     print_startup_info()
@@ -6,6 +6,7 @@ Handles PDF, DOCX, TXT, XLSX, XLS files
 import io
 import re
 import logging
+from functools import lru_cache, partial
 from typing import Dict, List, Any
 import asyncio
 
@@ -23,26 +24,35 @@ import tiktoken
 
 logger = logging.getLogger(__name__)
 
+# Text normalization patterns, compiled once at import
+WHITESPACE_RE = re.compile(r'\s+')
+BLANK_LINES_RE = re.compile(r'\n\s*\n')
+SENTENCE_END_RE = re.compile(r'[.!?]+')
+
 class DocumentProcessor:
     def __init__(self, chunk_size: int = 1000, chunk_overlap: int = 200):
         self.chunk_size = chunk_size
         self.chunk_overlap = chunk_overlap
         self.tokenizer = tiktoken.get_encoding("cl100k_base")
+        # Overlap windows re-count the same trailing words at every chunk boundary
+        self.count_word_tokens = lru_cache(maxsize=8192)(self._count_tokens)
+        # Text extractor for each supported file type
+        self.extractors = {
+            'pdf': self.extract_pdf_text,
+            'docx': self.extract_docx_text,
+            'txt': self.extract_txt_text,
+            'xlsx': partial(self.extract_excel_text, file_type='xlsx'),
+            'xls': partial(self.extract_excel_text, file_type='xls'),
+        }
     
     async def process_file(self, file_content: bytes, filename: str, file_type: str) -> Dict[str, Any]:
         """Process a file and return extracted content and chunks"""
         try:
             # Extract text based on file type
-            if file_type.lower() == 'pdf':
-                text = await self.extract_pdf_text(file_content)
-            elif file_type.lower() == 'docx':
-                text = await self.extract_docx_text(file_content)
-            elif file_type.lower() in ['txt']:
-                text = await self.extract_txt_text(file_content)
-            elif file_type.lower() in ['xlsx', 'xls']:
-                text = await self.extract_excel_text(file_content, file_type)
-            else:
+            extractor = self.extractors.get(file_type.lower())
+            if extractor is None:
                 raise ValueError(f"Unsupported file type: {file_type}")
+            text = await extractor(file_content)
             
             # Clean and normalize text
             text = self.clean_text(text)
@@ -70,18 +80,19 @@ class DocumentProcessor:
             pdf_file = io.BytesIO(file_content)
             pdf_reader = PyPDF2.PdfReader(pdf_file)
             
-            text = ""
+            # Collect pieces and join once instead of re-copying the text per page
+            parts = []
             for page_num, page in enumerate(pdf_reader.pages):
                 try:
                     page_text = page.extract_text()
                     if page_text:
-                        text += f"\n--- Page {page_num + 1} ---\n"
-                        text += page_text
+                        parts.append(f"\n--- Page {page_num + 1} ---\n")
+                        parts.append(page_text)
                 except Exception as e:
                     logger.warning(f"Error extracting text from page {page_num + 1}: {e}")
                     continue
             
-            return text
+            return "".join(parts)
             
         except Exception as e:
             logger.error(f"Error extracting PDF text: {e}")
@@ -93,10 +104,10 @@ class DocumentProcessor:
             docx_file = io.BytesIO(file_content)
             doc = Document(docx_file)
             
-            text = ""
+            parts = []
             for paragraph in doc.paragraphs:
                 if paragraph.text.strip():
-                    text += paragraph.text + "\n"
+                    parts.append(paragraph.text + "\n")
             
             # Extract text from tables
             for table in doc.tables:
@@ -106,9 +117,9 @@ class DocumentProcessor:
                         if cell.text.strip():
                             row_text.append(cell.text.strip())
                     if row_text:
-                        text += " | ".join(row_text) + "\n"
+                        parts.append(" | ".join(row_text) + "\n")
             
-            return text
+            return "".join(parts)
             
         except Exception as e:
             logger.error(f"Error extracting DOCX text: {e}")
@@ -139,32 +150,38 @@ class DocumentProcessor:
         """Extract text from Excel file"""
         try:
             excel_file = io.BytesIO(file_content)
+            parts = []
             
             if file_type.lower() == 'xlsx':
-                # Use openpyxl for .xlsx files
-                workbook = openpyxl.load_workbook(excel_file, data_only=True)
-                text = ""
-                
-                for sheet_name in workbook.sheetnames:
-                    sheet = workbook[sheet_name]
-                    text += f"\n--- Sheet: {sheet_name} ---\n"
-                    
-                    for row in sheet.iter_rows(values_only=True):
-                        row_text = []
-                        for cell in row:
-                            if cell is not None and str(cell).strip():
-                                row_text.append(str(cell).strip())
-                        if row_text:
-                            text += " | ".join(row_text) + "\n"
+                # Use openpyxl for .xlsx files; read-only mode streams rows
+                # instead of building every cell object up front
+                workbook = openpyxl.load_workbook(excel_file, read_only=True, data_only=True)
+
+                try:
+                    for sheet_name in workbook.sheetnames:
+                        sheet = workbook[sheet_name]
+                        # Read-only mode trusts the stored <dimension> record, which
+                        # some exporters write wrongly; recompute it from the data
+                        sheet.reset_dimensions()
+                        parts.append(f"\n--- Sheet: {sheet_name} ---\n")
+
+                        for row in sheet.iter_rows(values_only=True):
+                            row_text = []
+                            for cell in row:
+                                if cell is not None and str(cell).strip():
+                                    row_text.append(str(cell).strip())
+                            if row_text:
+                                parts.append(" | ".join(row_text) + "\n")
+                finally:
+                    workbook.close()
             else:
                 # Use pandas for .xls files (if available)
                 if PANDAS_AVAILABLE:
                     try:
                         excel_data = pd.read_excel(excel_file, sheet_name=None, engine='xlrd')
-                        text = ""
 
                         for sheet_name, df in excel_data.items():
-                            text += f"\n--- Sheet: {sheet_name} ---\n"
+                            parts.append(f"\n--- Sheet: {sheet_name} ---\n")
 
                             # Convert DataFrame to text
                             for _, row in df.iterrows():
@@ -173,13 +190,13 @@ class DocumentProcessor:
                                     if pd.notna(value) and str(value).strip():
                                         row_text.append(str(value).strip())
                                 if row_text:
-                                    text += " | ".join(row_text) + "\n"
+                                    parts.append(" | ".join(row_text) + "\n")
                     except Exception as e:
                         raise ValueError(f"Failed to process .xls file: {e}")
                 else:
                     raise ValueError("pandas is required for .xls files but is not installed. Please use .xlsx format instead.")
             
-            return text
+            return "".join(parts)
             
         except Exception as e:
             logger.error(f"Error extracting Excel text: {e}")
@@ -188,10 +205,10 @@ class DocumentProcessor:
     def clean_text(self, text: str) -> str:
         """Clean and normalize text"""
         # Remove excessive whitespace
-        text = re.sub(r'\s+', ' ', text)
+        text = WHITESPACE_RE.sub(' ', text)
         
         # Remove excessive newlines
-        text = re.sub(r'\n\s*\n', '\n\n', text)
+        text = BLANK_LINES_RE.sub('\n\n', text)
         
         # Strip leading/trailing whitespace
         text = text.strip()
@@ -211,7 +228,7 @@ class DocumentProcessor:
         start_char = 0
         
         for sentence in sentences:
-            sentence_tokens = len(self.tokenizer.encode(sentence))
+            sentence_tokens = self._count_tokens(sentence)
             
             # If adding this sentence would exceed chunk size, finalize current chunk
             if current_tokens + sentence_tokens > self.chunk_size and current_chunk:
@@ -233,7 +250,7 @@ class DocumentProcessor:
                 # Start new chunk with overlap
                 overlap_text = self.get_overlap_text(current_chunk, self.chunk_overlap)
                 current_chunk = overlap_text + " " + sentence if overlap_text else sentence
-                current_tokens = len(self.tokenizer.encode(current_chunk))
+                current_tokens = self._count_tokens(current_chunk)
                 start_char += len(chunk_content) - len(overlap_text)
             else:
                 # Add sentence to current chunk
@@ -256,10 +273,14 @@ class DocumentProcessor:
         
         return chunks
     
+    def _count_tokens(self, text: str) -> int:
+        """Count tokens in text"""
+        return len(self.tokenizer.encode(text))
+    
     def split_into_sentences(self, text: str) -> List[str]:
         """Split text into sentences"""
         # Simple sentence splitting - can be improved with more sophisticated methods
-        sentences = re.split(r'[.!?]+', text)
+        sentences = SENTENCE_END_RE.split(text)
         return [s.strip() for s in sentences if s.strip()]
     
     def get_overlap_text(self, text: str, max_tokens: int) -> str:
@@ -273,10 +294,12 @@ class DocumentProcessor:
         
         # Take words from the end until we reach max_tokens
         for word in reversed(words):
-            word_tokens = len(self.tokenizer.encode(word))
+            word_tokens = self.count_word_tokens(word)
             if token_count + word_tokens > max_tokens:
                 break
-            overlap_words.insert(0, word)
+            overlap_words.append(word)
             token_count += word_tokens
         
+        # Words were collected back to front
+        overlap_words.reverse()
         return " ".join(overlap_words)
@@ -8,6 +8,7 @@ import json
 import logging
 from typing import List, Dict, Any, Optional
 import asyncio
+from functools import lru_cache
 import uuid
 import pickle
 
@@ -28,6 +29,8 @@ class FAISSVectorStore:
     def __init__(self, data_dir: str, embedding_model: SentenceTransformer):
         self.data_dir = data_dir
         self.embedding_model = embedding_model
+        # Searches are often repeated, so keep recent query embeddings around
+        self.encode_query = lru_cache(maxsize=256)(self._encode_query)
         self.faiss_dir = os.path.join(data_dir, "faiss_db")
         self.index_file = os.path.join(self.faiss_dir, "index.faiss")
         self.metadata_file = os.path.join(self.faiss_dir, "metadata.json")
@@ -89,8 +92,10 @@ class FAISSVectorStore:
             if FAISS_AVAILABLE and self.index is not None:
                 faiss.write_index(self.index, self.index_file)
             
+            # Encode before opening so a failure can't leave metadata.json truncated
+            payload = json.dumps(self.metadata, separators=(',', ':'), default=str)
             with open(self.metadata_file, 'w', encoding='utf-8') as f:
-                json.dump(self.metadata, f, indent=2, default=str)
+                f.write(payload)
             
             logger.info(f"Saved FAISS index with {len(self.metadata)} chunks")
             
@@ -148,7 +153,7 @@ class FAISSVectorStore:
         """Search for similar chunks"""
         try:
             # Generate query embedding
-            query_embedding = await self.generate_embeddings([query])
+            query_embedding = await self.generate_query_embedding(query)
             query_embedding = query_embedding / np.linalg.norm(query_embedding, axis=1, keepdims=True)
             
             chunks = []
@@ -178,34 +183,35 @@ class FAISSVectorStore:
                             scores.append(float(similarity))
             
             elif not FAISS_AVAILABLE:
-                # Fallback: compute similarities manually
+                # Fallback: score all stored embeddings in a single matrix product
                 query_vec = query_embedding[0]
-                
-                for idx, metadata in self.metadata.items():
-                    if metadata.get('embedding'):
-                        chunk_vec = np.array(metadata['embedding'])
-                        similarity = np.dot(query_vec, chunk_vec)
-                        
-                        if similarity >= similarity_threshold:
-                            chunk = RAGChunk(
-                                id=metadata['chunk_id'],
-                                documentId=metadata['document_id'],
-                                content=metadata['content'],
-                                chunkIndex=metadata['chunk_index'],
-                                metadata={
-                                    "startChar": metadata['start_char'],
-                                    "endChar": metadata['end_char'],
-                                    "tokenCount": metadata['token_count']
-                                }
-                            )
-                            chunks.append(chunk)
-                            scores.append(float(similarity))
-                
-                # Sort by similarity
-                if chunks:
-                    sorted_pairs = sorted(zip(chunks, scores), key=lambda x: x[1], reverse=True)
-                    chunks, scores = zip(*sorted_pairs[:max_results])
-                    chunks, scores = list(chunks), list(scores)
+                entries = [metadata for metadata in self.metadata.values() if metadata.get('embedding')]
+
+                if entries:
+                    matrix = np.array([metadata['embedding'] for metadata in entries])
+                    similarities = matrix @ query_vec
+
+                    # Best matches first; stable so ties keep insertion order
+                    for i in np.argsort(-similarities, kind='stable')[:max_results]:
+                        similarity = similarities[i]
+                        # Written as "not >=" so NaN scores (zero-norm query) stop the scan too
+                        if not similarity >= similarity_threshold:
+                            break
+
+                        metadata = entries[i]
+                        chunk = RAGChunk(
+                            id=metadata['chunk_id'],
+                            documentId=metadata['document_id'],
+                            content=metadata['content'],
+                            chunkIndex=metadata['chunk_index'],
+                            metadata={
+                                "startChar": metadata['start_char'],
+                                "endChar": metadata['end_char'],
+                                "tokenCount": metadata['token_count']
+                            }
+                        )
+                        chunks.append(chunk)
+                        scores.append(float(similarity))
             
             logger.info(f"Found {len(chunks)} relevant chunks for query: {query[:50]}...")
             
@@ -221,21 +227,19 @@ class FAISSVectorStore:
     async def delete_document(self, doc_id: str):
         """Delete all chunks for a document"""
         try:
-            # Find chunks to delete
-            indices_to_delete = []
-            for idx, metadata in self.metadata.items():
-                if metadata['document_id'] == doc_id:
-                    indices_to_delete.append(idx)
-            
-            # Remove from metadata
-            for idx in indices_to_delete:
-                del self.metadata[idx]
+            # Keep every chunk of other documents in a single pass
+            remaining = {
+                idx: metadata for idx, metadata in self.metadata.items()
+                if metadata['document_id'] != doc_id
+            }
+            deleted_count = len(self.metadata) - len(remaining)
+            self.metadata = remaining
             
             # Note: FAISS doesn't support deletion, so we rebuild the index
-            if indices_to_delete:
+            if deleted_count:
                 await self.rebuild_index()
             
-            logger.info(f"Deleted {len(indices_to_delete)} chunks for document {doc_id}")
+            logger.info(f"Deleted {deleted_count} chunks for document {doc_id}")
             
         except Exception as e:
             logger.error(f"Error deleting document {doc_id} from vector store: {e}")
@@ -316,13 +320,34 @@ class FAISSVectorStore:
             logger.error(f"Error generating embeddings: {e}")
             raise
     
+    async def generate_query_embedding(self, query: str) -> np.ndarray:
+        """Generate embedding for a search query, reusing cached results"""
+        try:
+            # Collapsing whitespace widens cache hits and is lossless for the default
+            # all-MiniLM-L6-v2 WordPiece tokenizer; other models may tokenize it differently
+            normalized_query = ' '.join(query.split())
+            loop = asyncio.get_event_loop()
+            embedding = await loop.run_in_executor(
+                None,
+                self.encode_query,
+                normalized_query
+            )
+            
+            return embedding
+            
+        except Exception as e:
+            logger.error(f"Error generating query embedding: {e}")
+            raise
+    
+    def _encode_query(self, query: str) -> np.ndarray:
+        """Encode a single query with the embedding model"""
+        return self.embedding_model.encode([query])
+    
     def get_stats(self) -> Dict[str, Any]:
         """Get vector store statistics"""
         try:
             # Count unique documents
-            unique_docs = set()
-            for metadata in self.metadata.values():
-                unique_docs.add(metadata['document_id'])
+            unique_docs = {metadata['document_id'] for metadata in self.metadata.values()}
             
             return {
                 "total_chunks": len(self.metadata),
@@ -51,6 +51,9 @@ from models import (
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# File extensions accepted by the upload endpoint
+ALLOWED_FILE_TYPES = frozenset({'.pdf', '.docx', '.txt', '.xlsx', '.xls'})
+
 class RAGServer:
     def __init__(self):
         self.app = FastAPI(title="Professional RAG Server", version="1.0.0")
@@ -171,9 +174,8 @@ class RAGServer:
             """Upload and process a document"""
             try:
                 # Validate file type
-                allowed_types = ['.pdf', '.docx', '.txt', '.xlsx', '.xls']
                 file_ext = os.path.splitext(file.filename)[1].lower()
-                if file_ext not in allowed_types:
+                if file_ext not in ALLOWED_FILE_TYPES:
                     raise HTTPException(
                         status_code=400, 
                         detail=f"Unsupported file type: {file_ext}"
@@ -371,8 +373,10 @@ class RAGServer:
         """Save documents to storage"""
         try:
             data = [doc.dict() for doc in documents]
+            # One-shot C-encoder dump; an encoding error leaves documents.json untouched
+            payload = json.dumps(data, separators=(',', ':'), default=str)
             with open(self.documents_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, default=str)
+                f.write(payload)
         except Exception as e:
             logger.error(f"Error saving documents: {e}")
     
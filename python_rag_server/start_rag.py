@@ -10,14 +10,24 @@ import sys
 import subprocess
 import importlib
 import time
+from importlib import metadata
 from pathlib import Path
 
+try:
+    from packaging.specifiers import SpecifierSet
+    PACKAGING_AVAILABLE = True
+except ImportError:
+    PACKAGING_AVAILABLE = False
+
+BANNER_LINE = "=" * 50
+SEPARATOR_LINE = "-" * 50
+
 def print_header():
     """Print startup header"""
-    print("=" * 50)
+    print(BANNER_LINE)
     print("    Professional RAG Server")
     print("    HSR Construction Estimator")
-    print("=" * 50)
+    print(BANNER_LINE)
     print()
 
 def check_python_version():
@@ -32,11 +42,40 @@ def check_python_version():
     print("[OK] Python version is compatible")
     return True
 
+def version_specifier(version):
+    """Turn a pin like "3.3.1" or "<2.0.0,>=1.21.0" into a pip version specifier"""
+    if version[0].isdigit():
+        return f"=={version}"
+    return version
+
+def is_installed(package_name, version=None):
+    """Check if an installed package already satisfies the pinned version"""
+    # Packages with extras may be missing optional dependencies, let pip decide
+    if "[" in package_name:
+        return False
+
+    try:
+        installed_version = metadata.version(package_name)
+    except metadata.PackageNotFoundError:
+        return False
+
+    if version is None:
+        return True
+    if PACKAGING_AVAILABLE:
+        return SpecifierSet(version_specifier(version)).contains(installed_version, prereleases=True)
+    # Without packaging only exact pins can be checked
+    return installed_version == version
+
 def install_package(package_name, version=None, fallback=None):
     """Install a package with optional version and fallback"""
     try:
+        # Skip the pip subprocess when the requirement is already satisfied
+        if is_installed(package_name, version):
+            print(f"[OK] {package_name} already installed")
+            return True
+
         if version:
-            package_spec = f"{package_name}=={version}"
+            package_spec = f"{package_name}{version_specifier(version)}"
         else:
             package_spec = package_name
             
@@ -216,7 +255,7 @@ def start_server():
     print("Server will be available at: http://127.0.0.1:8001")
     print("Supports requests from: https://kapilmoond.github.io")
     print("Press Ctrl+C to stop the server")
-    print("-" * 50)
+    print(SEPARATOR_LINE)
 
     try:
         import uvicorn
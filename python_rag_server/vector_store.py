@@ -7,6 +7,7 @@ import os
 import logging
 from typing import List, Dict, Any, Optional
 import asyncio
+from functools import lru_cache
 import uuid
 
 import chromadb
@@ -22,6 +23,8 @@ class VectorStore:
     def __init__(self, data_dir: str, embedding_model: SentenceTransformer):
         self.data_dir = data_dir
         self.embedding_model = embedding_model
+        # The frontend repeats queries, so memoize their embeddings per instance
+        self.encode_query = lru_cache(maxsize=256)(self._encode_query)
         self.chroma_dir = os.path.join(data_dir, "chroma_db")
         
         # Initialize ChromaDB
@@ -94,7 +97,7 @@ class VectorStore:
         """Search for similar chunks"""
         try:
             # Generate query embedding
-            query_embedding = await self.generate_embeddings([query])
+            query_embedding = await self.generate_query_embedding(query)
             
             # Search in ChromaDB
             results = self.collection.query(
@@ -196,6 +199,30 @@ class VectorStore:
             logger.error(f"Error generating embeddings: {e}")
             raise
     
+    async def generate_query_embedding(self, query: str) -> List[List[float]]:
+        """Generate embedding for a search query, reusing cached results"""
+        try:
+            # The collapsed text is also what gets encoded, which only leaves the
+            # embedding unchanged for whitespace-splitting tokenizers such as the
+            # default MiniLM one
+            normalized_query = ' '.join(query.split())
+            loop = asyncio.get_event_loop()
+            embedding = await loop.run_in_executor(
+                None,
+                self.encode_query,
+                normalized_query
+            )
+            
+            return embedding.tolist()
+            
+        except Exception as e:
+            logger.error(f"Error generating query embedding: {e}")
+            raise
+    
+    def _encode_query(self, query: str) -> np.ndarray:
+        """Run the embedding model on one query"""
+        return self.embedding_model.encode([query])
+    
     def get_stats(self) -> Dict[str, Any]:
         """Get vector store statistics"""
         try:
@@ -205,10 +232,7 @@ class VectorStore:
             total_chunks = len(collection_info['ids']) if collection_info['ids'] else 0
             
             # Count unique documents
-            unique_docs = set()
-            if collection_info['metadatas']:
-                for metadata in collection_info['metadatas']:
-                    unique_docs.add(metadata['document_id'])
+            unique_docs = {metadata['document_id'] for metadata in collection_info['metadatas'] or []}
             
             return {
                 "total_chunks": total_chunks,